@@ -1,4 +1,10 @@
-from helpers import *
+from helpers import (
+    read_gateware_json,
+    create_folders,
+    copy_packaging_folder,
+    clean_up_files,
+    update_apf_core_json,
+)
 
 
 def main():
@@ -28,35 +28,48 @@
 * SOFTWARE.
 ********************************************************************************
 """
+import importlib
 import sys
 
-from .release import *
-from .discord import *
-from .package import *
-from .json import *
-from .quartus import *
-
 sys.tracebacklimit = 0
 
-__all__ = [
+# Public helpers mapped to the submodule defining them. Submodules are only
+# imported on first access, so scripts that never touch HTTP or Docker do not
+# pay for loading requests or python_on_whales.
+_LAZY = {
     # JSON Helpers
-    "read_json_file",
-    "save_json_file",
-    "read_gateware_json",
-    "update_apf_core_json",
+    "read_json_file": ".json",
+    "save_json_file": ".json",
+    "read_gateware_json": ".json",
+    "update_apf_core_json": ".json",
     # Quartus
-    "run_quartus_compile",
+    "run_quartus_compile": ".quartus",
     # Package
-    "create_folders",
-    "copy_packaging_folder",
-    "clean_up_files",
-    "create_release_package",
-    "create_metadata_package",
-    "create_tar_gz",
-    "create_zip_file",
-    "reverse_bitstream",
+    "create_folders": ".package",
+    "copy_packaging_folder": ".package",
+    "clean_up_files": ".package",
+    "create_release_package": ".package",
+    "create_metadata_package": ".package",
+    "create_tar_gz": ".package",
+    "create_zip_file": ".package",
+    "reverse_bitstream": ".package",
     # Release
-    "create_gh_release",
+    "create_gh_release": ".release",
     # Discord
-    "send_discord_announcement",
-]
+    "send_discord_announcement": ".discord",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
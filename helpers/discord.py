@@ -31,8 +31,30 @@
 import os
 import requests
 import json
-
-
+import tempfile
+import threading
+import time
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+from .session import DEFAULT_TIMEOUT, SESSION
+
+
+# Human-readable names for the supported target platforms
+PLATFORM_NAMES = {
+    "pocket": "Analogue Pocket",
+    "mist": "MiST",
+    "sidi": "SiDi",
+    "mister": "MiSTer",
+    "neptuno": "NeptUNO",
+    "cyc1000": "Trenz CYC1000",
+    "deca": "Arrow DECA",
+    "tc64v1": "Turbo Chameleon 64 v1",
+    "tc64v2": "Turbo Chameleon 64 v2",
+}
+
+
+@lru_cache(maxsize=32)
 def get_platform_name(target, board=None):
     """
     Determines the platform name based on the given target identifier.
@@ -41,35 +63,25 @@ def get_platform_name(target, board=None):
     - target (str): The target platform identifier (e.g., "pocket", "mimic", "deca").
 
     Returns:
-    - str: A human-readable name for the platform.
+    - str: A human-readable name for the platform, or the identifier itself if it is unknown.
     """
-    match target:
-        case "mimic":
-            return f"MiMiC NSX for {board}"
-        case "pocket":
-            return "Analogue Pocket"
-        case "mist":
-            return "MiST"
-        case "sidi":
-            return "SiDi"
-        case "mister":
-            return "MiSTer"
-        case "neptuno":
-            return "NeptUNO"
-        case "cyc1000":
-            return "Trenz CYC1000"
-        case "deca":
-            return "Arrow DECA"
-        case "tc64v1":
-            return "Turbo Chameleon 64 v1"
-        case "tc64v2":
-            return "Turbo Chameleon 64 v2"
+    if target == "mimic":
+        return f"MiMiC NSX for {board}"
+    return PLATFORM_NAMES.get(target, target)
+
 
+# How long an avatar URL cached on disk is considered fresh, in seconds
+AVATAR_CACHE_TTL = 24 * 60 * 60
 
+
+@lru_cache(maxsize=64)
 def get_github_user_avatar_url(username):
     """
     Fetches the avatar URL of a GitHub user.
 
+    Results are cached in memory for the current run and on disk for a day,
+    which keeps the unauthenticated users endpoint out of most announcements.
+
     Parameters:
     - username: GitHub username of the user whose avatar URL you want to fetch.
 
@@ -77,12 +89,27 @@ def get_github_user_avatar_url(username):
     - The avatar URL if the user exists and the request was successful.
     - None if the user does not exist or the request failed.
     """
+    cache_file = os.path.join(tempfile.gettempdir(), f"ppb-avatar-{username}")
+    try:
+        if time.time() - os.path.getmtime(cache_file) < AVATAR_CACHE_TTL:
+            with open(cache_file, 'r') as file:
+                return file.read().strip()
+    except OSError:
+        pass
+
     url = f"https://api.github.com/users/{username}"
-    response = requests.get(url)
+    response = SESSION.get(url, timeout=DEFAULT_TIMEOUT)
 
     if response.status_code == 200:
         data = response.json()
-        return data.get('avatar_url')
+        avatar_url = data.get('avatar_url')
+        if avatar_url:
+            try:
+                with open(cache_file, 'w') as file:
+                    file.write(avatar_url)
+            except OSError:
+                pass
+        return avatar_url
     else:
         print(f"Failed to fetch user data. Status code: {response.status_code}")
         return None
@@ -98,16 +125,8 @@ def format_download_links(urls):
     Returns:
     - str: A string containing Markdown-formatted links, one per line.
     """
-    # Initialize an empty string to hold the formatted download links
-    download_links = ""
-
-    for url in urls:
-        # Extract the filename from the URL
-        filename = url.split('/')[-1]
-        # Append the Markdown link for this file to the download_links string
-        download_links += f"- [{filename}]({url})\n"
-
-    return download_links
+    # Build one Markdown link per URL, using the last path segment as the filename
+    return "".join(f"- [{url.rsplit('/', 1)[-1]}]({url})\n" for url in urls)
 
 
 def send_discord_announcement(config, files):
@@ -138,6 +157,15 @@ def send_discord_announcement(config, files):
         print("No valid download URLs found. Skipping Discord announcement.")
         return
 
+    # Find all environment variables that start with the prefix "WEBHOOK_"
+    prefix = "WEBHOOK_"
+    webhook_env_vars = {key: value for key, value in os.environ.items() if key.startswith(prefix)}
+
+    # If no webhooks are configured, skip building the announcement entirely
+    if not webhook_env_vars:
+        print("No Discord webhooks configured. Skipping Discord announcement.")
+        return
+
     # Prepare the announcement content
     repo = f'{os.getenv("GITHUB_REPOSITORY")}'
     version = f'{os.getenv("GITHUB_REF_NAME")}'
@@ -177,21 +205,32 @@ def send_discord_announcement(config, files):
         }]
     }
 
-    # Find all environment variables that start with the prefix "WEBHOOK_"
-    prefix = "WEBHOOK_"
-    webhook_env_vars = {key: value for key, value in os.environ.items() if key.startswith(prefix)}
+    # The payload is identical for every webhook, so serialize it only once
+    body = json.dumps(data).encode("utf-8")
+
+    print_lock = threading.Lock()
 
-    # Dispatch message to each webhook
-    for server, webhook in webhook_env_vars.items():
+    def log(message):
+        # Keep lines from concurrent workers from interleaving
+        with print_lock:
+            print(message)
+
+    def post_announcement(item):
+        server, webhook = item
+        name = server.removeprefix(prefix).lower()
         if webhook:
             try:
-                print(f"Sending announcement to {server.removeprefix(prefix).lower()}...")
-                response = requests.post(webhook, headers=headers, data=json.dumps(data))
+                log(f"Sending announcement to {name}...")
+                response = SESSION.post(webhook, headers=headers, data=body, timeout=DEFAULT_TIMEOUT)
                 if response.status_code != 204:
-                    print(f"Error sending Discord notification: {response.content}")
+                    log(f"Error sending Discord notification: {response.content}")
                 else:
-                    print(f"Announcement sent successfully to {server.removeprefix(prefix).lower()}.")
+                    log(f"Announcement sent successfully to {name}.")
             except requests.exceptions.RequestException as e:
-                print(f"Failed to send message due to an error: {e}")
+                log(f"Failed to send message due to an error: {e}")
         else:
-            print(f"No valid webhook detected for {server.removeprefix(prefix).lower()}")
+            log(f"No valid webhook detected for {name}")
+
+    # Dispatch message to all webhooks concurrently
+    with ThreadPoolExecutor(max_workers=min(16, len(webhook_env_vars))) as executor:
+        list(executor.map(post_announcement, webhook_env_vars.items()))
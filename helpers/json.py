@@ -32,9 +32,18 @@ import json
 import os
 from datetime import date
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def read_json_file(json_path):
     try:
+        if orjson is not None:
+            with open(json_path, 'rb') as file:
+                return orjson.loads(file.read())
+
         with open(json_path, 'r') as file:
             data = json.load(file)
             return data
@@ -98,5 +107,5 @@ def update_apf_core_json(config):
         print("Error: JSON structure is not as expected.")
         return
 
-    # Write the updated JSON back to the file
-    save_json_file(json_path, data, True)
+    # Write the updated JSON back to the file, dumping it only when debugging
+    save_json_file(json_path, data, debug=bool(os.getenv('PPB_DEBUG')))
@@ -28,12 +28,32 @@
 ********************************************************************************
 """
 
-import glob
+import gzip
 import os
 import shutil
 import zipfile
 import tarfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from functools import lru_cache
+
+# Worker count for file system operations, which mostly wait on I/O
+IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Buffer size for streaming file contents, 1 MiB
+COPY_BUFFER_SIZE = 1 << 20
+
+# DEFLATE level for release archives, favouring packaging speed over size
+COMPRESS_LEVEL = 1
+
+# Already-compressed formats that DEFLATE cannot shrink, so they are stored as is.
+# Bitstreams are left out on purpose: unused FPGA resources make them compress well.
+STORED_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".zip", ".gz", ".bz2", ".xz", ".7z")
+
+# Lookup table mapping every byte value to the same byte with its bits reversed
+BIT_REVERSE_TABLE = bytes(int(f"{i:08b}"[::-1], 2) for i in range(256))
 
 
 def create_folders(config):
@@ -44,18 +64,22 @@ def create_folders(config):
     - config (dict): Configuration object containing folder paths.
 
     Side effects:
-    - Removes existing stage and release folders if they exist.
+    - Removes existing stage and release folders if they exist, in a background thread.
     - Creates new stage and release folders.
     """
     folders = config["release"]["folders"]
-    stage_folder = folders["stage_folder"]
-    release_folder = folders["release_folder"]
     try:
-        shutil.rmtree(stage_folder, ignore_errors=True)
-        os.makedirs(stage_folder)
-
-        shutil.rmtree(release_folder, ignore_errors=True)
-        os.makedirs(release_folder)
+        for key in ("stage_folder", "release_folder"):
+            folder = os.path.normpath(folders[key])
+            if os.path.exists(folder):
+                # Renaming is instant, so move the old folder aside and delete it
+                # in the background while the rest of the pipeline carries on
+                old_folder = f"{folder}.old.{os.getpid()}.{time.time_ns()}"
+                os.rename(folder, old_folder)
+                threading.Thread(
+                    target=shutil.rmtree, args=(old_folder,), kwargs={"ignore_errors": True}
+                ).start()
+            os.makedirs(folder)
 
     except IOError as e:
         print(f"An error occurred: {e}")
@@ -83,17 +107,31 @@ def copy_packaging_folder(config, subpath=None):
     if not os.path.exists(destination):
         os.makedirs(destination)
 
-    for item in os.listdir(source):
-        src_path = os.path.join(source, item)
-        dest_path = os.path.join(destination, item)
-        print(item)
-        print(src_path)
-        print(dest_path)
-
-        if os.path.isdir(src_path):
-            shutil.copytree(src_path, dest_path, dirs_exist_ok=True)
+    # Collect every file to copy in one pass and recreate the directory tree first,
+    # following symlinked directories like shutil.copytree does
+    copies = []
+    dest_dirs = set()
+    for src_path, relpath, is_empty_dir in scan_tree(source, follow_symlinks=True):
+        dest_path = os.path.join(destination, relpath)
+        if is_empty_dir:
+            dest_dirs.add(dest_path)
         else:
-            shutil.copy2(src_path, dest_path)
+            dest_dirs.add(os.path.dirname(dest_path))
+            copies.append((src_path, dest_path))
+
+    for dest_dir in dest_dirs:
+        os.makedirs(dest_dir, exist_ok=True)
+
+    def copy_file(paths):
+        src_path, dest_path = paths
+        shutil.copy2(src_path, dest_path)
+        return dest_path
+
+    # Copy the files concurrently to overlap the per-file syscall latency, shutil.copy2
+    # already uses the kernel's zero-copy path (sendfile) where the platform supports it
+    with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+        for dest_path in executor.map(copy_file, copies):
+            print(dest_path)
 
 
 def clean_up_files(config):
@@ -104,22 +142,65 @@ def clean_up_files(config):
     - config (dict): Configuration object containing the path to the staging folder.
 
     Side effects:
-    - Deletes files matching specified patterns (e.g., "*.png", "*.rom", "*.gitkeep").
+    - Deletes files matching specified patterns (e.g., "*.png", "*.rom", "*.gitkeep"),
+      skipping hidden folders and dot-prefixed names other than ".gitkeep".
     """
     folders = config["release"]["folders"]
     stage_folder = folders["stage_folder"]
 
     print("Cleaning Up Files...")
-    # Define patterns for unwanted files
-    file_patterns = ["*.png", "*.rom", ".gitkeep"]
+    # Define extensions and exact names of unwanted files
+    file_extensions = (".png", ".rom")
+    file_names = {".gitkeep"}
+
+    # Find every unwanted file in a single walk of the staging folder. Like the
+    # glob patterns this replaces, hidden folders are left alone and extensions
+    # only match names that do not start with a dot.
+    filenames = []
+    for file_path, relpath, is_empty_dir in scan_tree(stage_folder):
+        *parents, name = relpath.split(os.sep)
+        if is_empty_dir or any(parent.startswith(".") for parent in parents):
+            continue
+        if name in file_names or (not name.startswith(".") and name.endswith(file_extensions)):
+            print(f"Removing {file_path}...")
+            filenames.append(file_path)
+
+    # Remove the files concurrently, unlinks are independent of each other
+    with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+        list(executor.map(os.remove, filenames))
+
+
+def scan_tree(source_dir, follow_symlinks=False):
+    """
+    Walks a directory tree using os.scandir and an explicit stack.
+
+    Directory entries carry their file type, so no extra stat call is needed per file,
+    and the explicit stack avoids recursion on deep trees.
+
+    Parameters:
+    - source_dir (str): Path to the directory to walk.
+    - follow_symlinks (bool): Whether to descend into symlinked directories.
+
+    Yields:
+    - tuple: (str, str, bool) - The entry path, its path relative to source_dir and
+             whether the entry is an empty directory rather than a file.
+    """
+    stack = [(source_dir, "")]
+    while stack:
+        path, prefix = stack.pop()
+        with os.scandir(path) as it:
+            entries = list(it)
+
+        if not entries and prefix:
+            yield path, prefix.rstrip(os.sep), True
+            continue
 
-    for pattern in file_patterns:
-        # Use glob to find all files matching the pattern
-        for filename in glob.glob(
-            os.path.join(stage_folder, "**", pattern), recursive=True
-        ):
-            print(f"Removing {filename}...")
-            os.remove(filename)
+        for entry in entries:
+            arcname = prefix + entry.name
+            if entry.is_dir(follow_symlinks=follow_symlinks):
+                stack.append((entry.path, arcname + os.sep))
+            elif entry.is_file():
+                yield entry.path, arcname, False
 
 
 def create_tar_gz(source_dir, output_filename):
@@ -132,15 +213,14 @@ def create_tar_gz(source_dir, output_filename):
     """
     print(f"Packing contents of {source_dir} into {output_filename}...")
     try:
-        with tarfile.open(output_filename, "w:gz") as tar:
+        # Write the tar as a stream through a large buffer, compressing with gzip
+        # directly (stream mode only accepts a compression level from Python 3.12)
+        with gzip.open(output_filename, "wb", compresslevel=COMPRESS_LEVEL) as gz, \
+                tarfile.open(fileobj=gz, mode="w|", bufsize=COPY_BUFFER_SIZE) as tar:
             # Walk through everything inside source_dir
-            for root, dirs, files in os.walk(source_dir):
-                for file in files:
-                    # Full path to the file
-                    file_path = os.path.join(root, file)
-                    # Relative path to the file inside source_dir
-                    arcname = os.path.relpath(str(file_path), start=source_dir)
-                    tar.add(str(file_path), arcname=arcname)
+            for file_path, arcname, is_empty_dir in scan_tree(source_dir):
+                if not is_empty_dir:
+                    tar.add(file_path, arcname=arcname)
         print(f"Archive {output_filename} created successfully.")
     except Exception as e:
         print(f"An error occurred while creating the archive: {e}")
@@ -156,30 +236,43 @@ def create_zip_file(source_dir, output_filename):
     """
     print(f"Packing contents of {source_dir} into {output_filename}...")
     try:
-        with zipfile.ZipFile(output_filename, "w", zipfile.ZIP_DEFLATED) as zipf:
+        with zipfile.ZipFile(
+            output_filename, "w", zipfile.ZIP_DEFLATED, compresslevel=COMPRESS_LEVEL
+        ) as zipf:
             # Walk through everything inside source_dir
-            for root, dirs, files in os.walk(source_dir):
-                if not files and not dirs:
+            for file_path, arcname, is_empty_dir in scan_tree(source_dir):
+                if is_empty_dir:
                     # Write empty folder
-                    arcname = os.path.relpath(str(root), start=source_dir)
-                    print(f"Ziping empty folder {root} as {arcname}")
+                    print(f"Ziping empty folder {file_path} as {arcname}")
                     zip_info = zipfile.ZipInfo(arcname)
                     zip_info.external_attr = 0o40755 << 16  # drwxr-xr-x permissions
                     zipf.writestr(str(arcname) + "/", b"")
                     continue
 
-                for file in files:
-                    # Full path to the file
-                    file_path = os.path.join(root, file)
-                    # Relative path to the file inside source_dir
-                    arcname = os.path.relpath(str(file_path), start=source_dir)
-                    print(f"Zipping file {file_path} as {arcname}")
-                    zipf.write(str(file_path), str(arcname))
+                print(f"Zipping file {file_path} as {arcname}")
+                if arcname.lower().endswith(STORED_EXTENSIONS):
+                    compress_type = zipfile.ZIP_STORED
+                else:
+                    compress_type = zipfile.ZIP_DEFLATED
+                zipf.write(file_path, arcname, compress_type=compress_type)
         print(f"Archive {output_filename} created successfully.")
     except Exception as e:
         print(f"An error occurred while creating the archive: {e}")
 
 
+@lru_cache(maxsize=1)
+def get_release_version():
+    """
+    Returns the release version, taken from the last component of GITHUB_REF.
+
+    The value does not change during a run, so it is computed only once.
+
+    Returns:
+    - str: The release version (e.g., "1.0.0" for "refs/tags/1.0.0").
+    """
+    return os.getenv("GITHUB_REF").split("/")[-1]
+
+
 def create_release_package(config, target):
     """
     Creates a release package as a zip file based on configuration and target environment.
@@ -192,12 +285,14 @@ def create_release_package(config, target):
     """
     print("Creating release package...")
     current_date = date.today().strftime("%Y-%m-%d")
-    version = os.getenv("GITHUB_REF").split("/")[-1]
-    release_folder = config["release"]["folders"]["release_folder"]
+    version = get_release_version()
+    folders = config["release"]["folders"]
+    target_config = config["release"]["target"][target]
+    release_folder = folders["release_folder"]
 
-    if "release_file" in config["release"]["target"][target]:
-        stage_folder = config["release"]["folders"]["stage_folder"]
-        release_file = config["release"]["target"][target]["release_file"].format(
+    if "release_file" in target_config:
+        stage_folder = folders["stage_folder"]
+        release_file = target_config["release_file"].format(
             author=f"{config['author']}",
             core=f"{config['name']}",
             version=f"{version}",
@@ -217,23 +312,28 @@ def create_release_package(config, target):
 
 def create_metadata_package(config, target):
     """
-    Creates a metadata package as a zip file based on configuration and target environment.
+    Creates metadata packages based on configuration and target environment.
+
+    The archive formats are taken from the optional "metadata_formats" list of the
+    target configuration ("zip" and/or "targz"), defaulting to a zip file only.
 
     Parameters:
     - config (dict): Configuration object containing metadata information and file paths.
 
     Returns:
-    - str: The filename of the created metadata package.
+    - list of str: The filenames of the created metadata packages.
     """
     print("Creating metadata package...")
     current_date = date.today().strftime("%Y%m%d")
-    version = os.getenv("GITHUB_REF").split("/")[-1]
-    release_folder = config["release"]["folders"]["release_folder"]
+    version = get_release_version()
+    folders = config["release"]["folders"]
+    target_config = config["release"]["target"][target]
+    release_folder = folders["release_folder"]
 
-    if "metadata_file" in config["release"]["target"][target]:
-        meta_folder = config["release"]["folders"]["meta_folder"]
+    if "metadata_file" in target_config:
+        meta_folder = folders["meta_folder"]
         meta_file = (
-            config["release"]["target"][target]["metadata_file"]
+            target_config["metadata_file"]
             .format(
                 author=f"{config['author']}",
                 core=f"{config['name']}",
@@ -243,14 +343,23 @@ def create_metadata_package(config, target):
             .lower()
         )
 
-        create_zip_file(meta_folder, os.path.join(release_folder, f"{meta_file}.zip"))
-        # create_tar_gz(meta_folder, os.path.join(release_folder, f"{meta_file}.tar.gz"))
-        return f"{meta_file}.zip"
+        # Only build the formats consumers asked for
+        meta_files = []
+        for meta_format in target_config.get("metadata_formats", ["zip"]):
+            if meta_format == "zip":
+                create_zip_file(meta_folder, os.path.join(release_folder, f"{meta_file}.zip"))
+                meta_files.append(f"{meta_file}.zip")
+            elif meta_format == "targz":
+                create_tar_gz(meta_folder, os.path.join(release_folder, f"{meta_file}.tar.gz"))
+                meta_files.append(f"{meta_file}.tar.gz")
+            else:
+                print(f"Unknown metadata format '{meta_format}'. Skipping.")
+        return meta_files
     else:
         print(
             "No metadata file configuration found. Skipping metadata package creation."
         )
-        return None
+        return []
 
 
 def reverse_bitstream(source, destination):
@@ -268,28 +377,15 @@ def reverse_bitstream(source, destination):
     # source_rbf_file = f"{config['release']['folders']['output_folder']}/{config['name']}_{target}.rbf"
     # reverse_rbf_file = f"{config['release']['folders']['stage_folder']}/Cores/{config['author']}.{config['name']}/bitstream.rbf_r"
     try:
-        # Read the input file
-        with open(source, "rb") as file:
-            byte_array = bytearray(file.read())
-
-        # Reverse the bits in each byte
-        for i in range(len(byte_array)):
-            byte_array[i] = (
-                ((byte_array[i] & 0x01) << 7)
-                | ((byte_array[i] & 0x02) << 5)
-                | ((byte_array[i] & 0x04) << 3)
-                | ((byte_array[i] & 0x08) << 1)
-                | ((byte_array[i] & 0x10) >> 1)
-                | ((byte_array[i] & 0x20) >> 3)
-                | ((byte_array[i] & 0x40) >> 5)
-                | ((byte_array[i] & 0x80) >> 7)
-            )
-
-        # Write the reversed bytes to the output file
-        with open(destination, "wb") as file:
-            file.write(byte_array)
-
-        print(f"Reversed {len(byte_array)} bytes and saved to {destination}")
+        total = 0
+        # Stream the file in fixed-size chunks so memory use does not grow with the bitstream
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            while chunk := src.read(COPY_BUFFER_SIZE):
+                # Reverse the bits in each byte with a single table lookup pass
+                dst.write(chunk.translate(BIT_REVERSE_TABLE))
+                total += len(chunk)
+
+        print(f"Reversed {total} bytes and saved to {destination}")
 
     except IOError as e:
         print(f"An error occurred: {e}")
@@ -29,6 +29,7 @@
 """
 
 import os
+import sys
 
 from python_on_whales import DockerException, docker
 
@@ -51,7 +52,7 @@ def run_quartus_compile(config):
     - GITHUB_WORKSPACE: The root directory of the GitHub workspace. This directory is mounted to the
                         Docker container to allow access to the project files.
 
-    The function streams the output of the Docker command to stdout. In case of a Docker-related error,
+    The function streams the output of the Docker command to stdout and stderr. In case of a Docker-related error,
     it catches the exception and prints the error message along with the Docker command and exit code.
 
     Exceptions:
@@ -77,8 +78,14 @@ def run_quartus_compile(config):
                 name=f"{target}"
         )
 
-        for stream_content in output:
-            print(stream_content)
+        # Output arrives as (source, bytes) tuples, write the raw bytes straight to the
+        # matching binary stream instead of decoding and printing every line
+        sys.stdout.flush()
+        sinks = {"stdout": sys.stdout.buffer, "stderr": sys.stderr.buffer}
+        for source, content in output:
+            sinks[source].write(content)
+        sys.stdout.buffer.flush()
+        sys.stderr.buffer.flush()
 
         print("Done")
     except DockerException as e:
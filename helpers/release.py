@@ -29,12 +29,37 @@
 """
 
 import os
-import requests
-import json
+import mmap
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
+from .session import DEFAULT_TIMEOUT, SESSION, UPLOAD_TIMEOUT
 
+# Responses from the releases API keyed by URL, stored as (ETag, data) so
+# repeated lookups can be answered with a conditional request
+_releases_cache = {}
+
+
+@lru_cache(maxsize=1)
 def get_current_git_branch():
+    # GitHub Actions already exposes the branch, GITHUB_HEAD_REF on pull requests
+    # and GITHUB_REF_NAME on pushes (where it holds the tag name for tag pushes)
+    branch_name = os.getenv("GITHUB_HEAD_REF")
+    if not branch_name and os.getenv("GITHUB_REF_TYPE") == "branch":
+        branch_name = os.getenv("GITHUB_REF_NAME")
+    if branch_name:
+        return branch_name
+
+    # Locally, read the symbolic ref straight from .git/HEAD
+    try:
+        with open(os.path.join(".git", "HEAD"), "r") as file:
+            head = file.readline().strip()
+        if head.startswith("ref: refs/heads/"):
+            return head.removeprefix("ref: refs/heads/")
+    except OSError:
+        pass
+
     try:
         # Run the git command to get the current branch name
         branch_name = subprocess.check_output(["git", "rev-parse", "--abbrev-ref", "HEAD"]).strip().decode('utf-8')
@@ -45,6 +70,53 @@ def get_current_git_branch():
         return None
 
 
+@lru_cache(maxsize=4)
+def github_headers(token):
+    """
+    Builds the headers shared by every GitHub API request, once per token.
+
+    The returned dict is shared between callers and must not be modified;
+    copy it to add request specific headers.
+
+    Parameters:
+    - token (str): GitHub authentication token.
+
+    Returns:
+    - dict: The authorization and accept headers.
+    """
+    return {
+        "Authorization": f"token {token}",
+        "Accept": "application/vnd.github.v3+json"
+    }
+
+
+def get_cached_json(url, headers):
+    """
+    Performs a conditional GET request, reusing the cached body when GitHub replies 304.
+
+    Parameters:
+    - url (str): The GitHub API URL to query.
+    - headers (dict): Request headers, including authentication.
+
+    Returns:
+    - tuple: (int, object) - The HTTP status code and the decoded JSON body, or the raw error body on failure.
+    """
+    headers = dict(headers)
+    cached = _releases_cache.get(url)
+    if cached:
+        # A 304 reply does not count against the API rate limit
+        headers["If-None-Match"] = cached[0]
+    response = SESSION.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
+    if response.status_code == 304:
+        return 200, cached[1]
+    if response.status_code == 200:
+        data = response.json()
+        if 'ETag' in response.headers:
+            _releases_cache[url] = (response.headers['ETag'], data)
+        return 200, data
+    return response.status_code, response.content
+
+
 def release_exists(repo, token, tag_name):
     """
      Checks if a release with the specified tag name exists.
@@ -59,20 +131,24 @@ def release_exists(repo, token, tag_name):
      - Exception: If there's an issue querying the GitHub API.
      """
     gh_url = os.getenv("GITHUB_API_URL")
-    url = f"{gh_url}/repos/{repo}/releases"
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
-    response = requests.get(url, headers=headers)
-    if response.status_code == 200:
-        releases = response.json()
-        for release in releases:
-            if release['tag_name'] == tag_name:
-                return True, release
-        return False, {}
-    else:
-        raise Exception(f"Error querying releases: {response.content}")
+    headers = github_headers(token)
+
+    # Published releases can be looked up directly by tag
+    status, release = get_cached_json(f"{gh_url}/repos/{repo}/releases/tags/{tag_name}", headers)
+    if status == 200:
+        return True, release
+    if status != 404:
+        raise Exception(f"Error querying releases: {release}")
+
+    # Draft releases are not attached to a tag yet, so they only show up in the listing.
+    # Releases are listed newest first, so the largest page covers any recent draft.
+    status, releases = get_cached_json(f"{gh_url}/repos/{repo}/releases?per_page=100", headers)
+    if status != 200:
+        raise Exception(f"Error querying releases: {releases}")
+    for release in releases:
+        if release['tag_name'] == tag_name:
+            return True, release
+    return False, {}
 
 
 def create_release(repo, token, tag_name):
@@ -90,10 +166,7 @@ def create_release(repo, token, tag_name):
     """
     gh_url = os.getenv("GITHUB_API_URL")
     url = f"{gh_url}/repos/{repo}/releases"
-    headers = {
-        "Authorization": f"token {token}",
-        "Content-Type": "application/json"
-    }
+    headers = github_headers(token)
     payload = {
         "tag_name": tag_name,
         "name": f"Release v{tag_name}",
@@ -101,7 +174,7 @@ def create_release(repo, token, tag_name):
         "draft": True,
         "prerelease": False
     }
-    response = requests.post(url, headers=headers, data=json.dumps(payload))
+    response = SESSION.post(url, headers=headers, json=payload, timeout=DEFAULT_TIMEOUT)
     if response.status_code == 201:
         return response.json()
     else:
@@ -157,11 +230,8 @@ def get_release_assets(repo, token, release_id):
     """
     gh_url = os.getenv("GITHUB_API_URL")
     url = f"{gh_url}/repos/{repo}/releases/{release_id}/assets"
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
-    response = requests.get(url, headers=headers)
+    headers = github_headers(token)
+    response = SESSION.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
     if response.status_code == 200:
         return response.json()
     else:
@@ -185,18 +255,15 @@ def delete_asset(repo, token, asset_id):
     """
     gh_url = os.getenv("GITHUB_API_URL")
     url = f"{gh_url}/repos/{repo}/releases/assets/{asset_id}"
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
-    response = requests.delete(url, headers=headers)
+    headers = github_headers(token)
+    response = SESSION.delete(url, headers=headers, timeout=DEFAULT_TIMEOUT)
     if response.status_code == 204:
         return True
     else:
         raise Exception(f"Error deleting asset: {response.content}")
 
 
-def upload_asset(upload_url, token, file_path, content_type, repo, release_id, asset_name):
+def upload_asset(upload_url, token, file_path, content_type, repo, release_id, asset_name, size=None):
     """
     Uploads an asset to a given release.
 
@@ -208,6 +275,7 @@ def upload_asset(upload_url, token, file_path, content_type, repo, release_id, a
     - repo (str): The repository in format "owner/repo".
     - release_id (int): The release ID.
     - asset_name (str): The name of the asset.
+    - size (int, optional): The file size in bytes, read from the file when not provided.
 
     Returns:
     - dict: The response from GitHub API for the uploaded asset.
@@ -215,12 +283,22 @@ def upload_asset(upload_url, token, file_path, content_type, repo, release_id, a
     Throws:
     - Exception: If there's an error uploading the asset via the GitHub API.
     """
+    if size is None:
+        size = os.path.getsize(file_path)
     headers = {
-        "Authorization": f"token {token}",
-        "Content-Type": content_type
+        **github_headers(token),
+        "Content-Type": content_type,
+        "Content-Length": str(size)
     }
     with open(file_path, 'rb') as file:
-        response = requests.post(upload_url, headers=headers, data=file)
+        if size == 0:
+            # Empty files cannot be memory-mapped
+            response = SESSION.post(upload_url, headers=headers, data=b"", timeout=UPLOAD_TIMEOUT)
+        else:
+            # Map the file so its pages are streamed from the OS cache instead of
+            # being copied into a Python buffer first
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                response = SESSION.post(upload_url, headers=headers, data=data, timeout=UPLOAD_TIMEOUT)
         if response.status_code == 201:
             return response.json()
         else:
@@ -232,7 +310,8 @@ def create_gh_release(config, files):
     Creates a GitHub release and uploads specified files as assets.
 
     Parameters:
-    - config (dict): Configuration details for the release, including the release folder path.
+    - config (dict): Configuration details for the release, including the release folder path
+                     and an optional 'upload_concurrency' (default 8, capped at 15).
     - files (list of str): Filenames of the assets to be uploaded.
 
     Returns:
@@ -252,21 +331,50 @@ def create_gh_release(config, files):
     repo = os.getenv("GITHUB_REPOSITORY")
     token = os.getenv("GITHUB_TOKEN")
     tag_name = os.getenv("GITHUB_REF_NAME")
-    
+    # GitHub starts rejecting uploads under heavy parallelism, keep it bounded
+    max_workers = max(1, min(config['release'].get('upload_concurrency', 8), 15))
+
+    # Check every asset with a single directory scan so missing files are
+    # reported before any request is made
+    with os.scandir(release_folder) as it:
+        entries = {entry.name: entry for entry in it if entry.is_file()}
+    missing = [f for f in valid_files if f not in entries]
+    if missing:
+        raise FileNotFoundError(f"Missing release file(s) in {release_folder}: {', '.join(missing)}")
+
     upload_url, release_id = get_upload_url(repo, token, tag_name)
 
+    # Strip the URI template once instead of expanding it for every file
+    assets_url = upload_url.replace("{?name,label}", "")
+
+    tasks = []
     for release_file in valid_files:
-        asset_upload_url = upload_url.replace("{?name,label}", f"?name={release_file}")
+        asset_upload_url = f"{assets_url}?name={release_file}"
         file_path = f'{release_folder}/{release_file}'
-        asset_info = upload_asset(
+        tasks.append((asset_upload_url, file_path, release_file, entries[release_file].stat().st_size))
+
+    # Uploads are network bound, so dispatch them concurrently and keep the
+    # results indexed by task to preserve the order of the input files
+    results = [None] * len(tasks)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                upload_asset,
                 asset_upload_url,
                 token,
                 file_path,
                 content_type,
                 repo=repo,
                 release_id=release_id,
-                asset_name=release_file
-        )
+                asset_name=release_file,
+                size=size
+            ): index
+            for index, (asset_upload_url, file_path, release_file, size) in enumerate(tasks)
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    for asset_info in results:
         if 'browser_download_url' in asset_info:
             download_urls.append(asset_info['browser_download_url'])
 
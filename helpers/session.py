@@ -0,0 +1,86 @@
+"""
+********************************************************************************
+* SPDX-License-Identifier: MIT
+* SPDX-FileType: OTHER
+* SPDX-FileCopyrightText: (c) 2024, OpenGateware authors and contributors
+********************************************************************************
+*
+* HTTP Session
+* Copyright (c) 2024, Marcus Andrade <marcus@opengateware.org>
+*
+* Permission is hereby granted, free of charge, to any person obtaining a copy
+* of this software and associated documentation files (the "Software"), to deal
+* in the Software without restriction, including without limitation the rights
+* to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+* copies of the Software, and to permit persons to whom the Software is
+* furnished to do so, subject to the following conditions:
+*
+* The above copyright notice and this permission notice shall be included in
+* all copies or substantial portions of the Software.
+*
+* THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+* IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+* FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+* AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+* LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+* OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+* SOFTWARE.
+********************************************************************************
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) timeouts in seconds for API calls and for asset uploads,
+# which can legitimately take minutes for large files
+DEFAULT_TIMEOUT = (5, 60)
+UPLOAD_TIMEOUT = (5, 600)
+
+
+class RateLimitRetry(Retry):
+    """
+    Retry policy that also resends non-idempotent requests rejected with 429.
+
+    A rate limited request was never processed, so sending it again cannot
+    create a duplicate release, asset or announcement.
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if status_code == 429 and self.total:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def create_session():
+    """
+    Creates a requests session with connection pooling and automatic retries.
+
+    Reusing a single session keeps connections alive between calls, avoiding a
+    new TCP and TLS handshake for every request made to GitHub and Discord.
+    Failed responses are retried only for idempotent methods, except for 429.
+
+    Returns:
+    - requests.Session: A session with pooled adapters mounted for HTTP and HTTPS.
+    """
+    # POST is left out of allowed_methods: it is not idempotent, so a request that
+    # landed but failed on the way back must not be sent twice. Connection errors
+    # are still retried for every method, as nothing reached the server.
+    retries = RateLimitRetry(
+        total=5,
+        connect=3,
+        read=3,
+        backoff_factor=1.0,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "DELETE"]),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+SESSION = create_session()
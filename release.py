@@ -1,4 +1,4 @@
-from helpers import *
+from helpers import read_gateware_json, create_release_package, create_metadata_package, create_gh_release
 import argparse
 
 
@@ -11,10 +11,10 @@ def main():
     config = read_gateware_json()
     # Create zip files for distribution
     pkg_file = create_release_package(config, "pocket")
-    meta_file = create_metadata_package(config, "pocket")
+    meta_files = create_metadata_package(config, "pocket")
     # Create GitHub release
     if not args.norelease:
-        release_urls = create_gh_release(config, [pkg_file, meta_file])
+        release_urls = create_gh_release(config, [pkg_file, *meta_files])
     # Send Discord announcement
     # send_discord_announcement(config, release_urls)
 
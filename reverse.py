@@ -1,4 +1,4 @@
-from helpers import *
+from helpers import reverse_bitstream
 from sys import argv
 
 